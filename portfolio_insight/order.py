@@ -1,9 +1,14 @@
-import json
+import asyncio
 import logging
 from logging.handlers import RotatingFileHandler
 import configparser
-import random
 import re
+import secrets
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, partial
+from xml.etree import ElementTree as ET
+
+import orjson
 
 # loading configuration file
 config = configparser.ConfigParser()
@@ -20,6 +25,131 @@ fmt = logging.Formatter(FORMAT, datefmt="%m/%d/%Y %I:%M:%S %p")
 handler.setFormatter(fmt)
 logger.addHandler(handler)
 
+# accepted order parameter values
+_REQUIRED_ORDER_FIELDS = ("symbol", "order_action", "quantity", "price_type")
+_PRICE_TYPES = frozenset({"MARKET", "LIMIT"})
+_ORDER_ACTIONS = frozenset({"BUY", "SELL", "BUY_TO_COVER", "SELL_SHORT"})
+
+# query parameters for each order status bucket returned by view_orders
+_ORDER_STATUS_PARAMS = (
+    ("open", {"status": "OPEN"}),
+    ("executed", {"status": "EXECUTED"}),
+    ("individual_fills", {"status": "INDIVIDUAL_FILLS"}),
+    ("cancelled", {"status": "CANCELLED"}),
+    ("rejected", {"status": "REJECTED"}),
+    ("expired", {"status": "EXPIRED"}),
+)
+_ORDER_STATUS_KEYS = tuple(status_key for status_key, _ in _ORDER_STATUS_PARAMS)
+
+
+def _make_order_row(
+    instrument,
+    use_filled,
+    *,
+    order_id,
+    order_type,
+    price_type,
+    order_term,
+    limit_price,
+    status,
+    bid,
+    ask,
+    net_price,
+):
+    """
+    Build the order dictionary for a single order instrument
+
+    The order and order detail fields are shared by every instrument of an
+    order detail, so they are looked up once by the caller and passed in by
+    name.
+
+    :param instrument: instrument object from the orders API response
+    :param use_filled: report the filled quantity instead of the ordered quantity
+    :return: dictionary of order fields for the instrument
+    """
+    security_type = None
+    symbol = None
+
+    # Extract product information
+    if instrument is not None and "Product" in instrument:
+        product = instrument["Product"]
+        security_type = product.get("securityType")
+        symbol = product.get("symbol")
+
+    # For individual fills, use filled quantity instead of ordered quantity
+    filled_quantity = instrument.get("filledQuantity")
+    if use_filled and filled_quantity:
+        quantity = filled_quantity
+    else:
+        quantity = instrument.get("orderedQuantity")
+
+    return {
+        "order_id": order_id,
+        "order_type": order_type,
+        "price_type": price_type,
+        "order_term": order_term,
+        "limit_price": limit_price,
+        "status": status,
+        "security_type": security_type,
+        "symbol": symbol,
+        "order_action": instrument.get("orderAction"),
+        "quantity": quantity,
+        "filled_quantity": filled_quantity,
+        "average_execution_price": instrument.get("averageExecutionPrice"),
+        "bid": bid,
+        "ask": ask,
+        "net_price": net_price,
+    }
+
+
+def _next_client_order_id():
+    """Return a new random 10-digit client order ID"""
+    return 1_000_000_000 + secrets.randbelow(9_000_000_000)
+
+
+def _build_order_request(root_tag, order, preview_id=None):
+    """
+    Build the XML body of a preview or place order request
+
+    :param root_tag: PreviewOrderRequest or PlaceOrderRequest
+    :param order: validated order parameters including client_order_id
+    :param preview_id: preview ID to include for place order requests
+    :return: UTF-8 encoded XML payload
+    """
+    root = ET.Element(root_tag)
+    ET.SubElement(root, "orderType").text = "EQ"
+    ET.SubElement(root, "clientOrderId").text = str(order["client_order_id"])
+    if preview_id is not None:
+        preview_ids = ET.SubElement(root, "PreviewIds")
+        ET.SubElement(preview_ids, "previewId").text = str(preview_id)
+
+    order_node = ET.SubElement(root, "Order")
+    ET.SubElement(order_node, "allOrNone").text = "false"
+    ET.SubElement(order_node, "priceType").text = str(order["price_type"])
+    ET.SubElement(order_node, "orderTerm").text = str(
+        order.get("order_term", "GOOD_FOR_DAY")
+    )
+    ET.SubElement(order_node, "marketSession").text = "REGULAR"
+    ET.SubElement(order_node, "stopPrice")
+    ET.SubElement(order_node, "limitPrice").text = str(order.get("limit_price", ""))
+
+    instrument = ET.SubElement(order_node, "Instrument")
+    product = ET.SubElement(instrument, "Product")
+    ET.SubElement(product, "securityType").text = "EQ"
+    ET.SubElement(product, "symbol").text = str(order["symbol"])
+    ET.SubElement(instrument, "orderAction").text = str(order["order_action"])
+    ET.SubElement(instrument, "quantityType").text = "QUANTITY"
+    ET.SubElement(instrument, "quantity").text = str(order["quantity"])
+
+    return ET.tostring(root, encoding="utf-8")
+
+
+def _pretty_json(data):
+    """Serialize a parsed response for debug logging"""
+    return orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+    ).decode()
+
 
 class Order:
     def __init__(self, session, account, base_url):
@@ -27,44 +157,65 @@ class Order:
         self.account = account
         self.base_url = base_url
 
+        # the request prefix is fixed for the lifetime of the object
+        self._orders_url = (
+            base_url + "/v1/accounts/" + account["accountIdKey"] + "/orders"
+        )
+
+    # request headers are built on first use, so the consumer key is only
+    # required for API calls; the session copies headers before signing,
+    # so the cached dictionaries can be shared between requests
+    @cached_property
+    def _xml_headers(self):
+        """Headers for the XML order requests"""
+        return {
+            "Content-Type": "application/xml",
+            "consumerKey": config["DEFAULT"]["CONSUMER_KEY"],
+        }
+
+    @cached_property
+    def _json_headers(self):
+        """Headers for the JSON order list requests"""
+        return {"consumerkey": config["DEFAULT"]["CONSUMER_KEY"]}
+
     def _validate_order_params(self, order_params):
         """
-        Validate order parameters
+        Validate order parameters and normalize them for submission
 
         :param order_params: Dictionary containing order parameters
-        :return: Boolean indicating if parameters are valid
+        :return: Copy of the parameters with a client order ID, or None if invalid
         """
-        required_fields = ["symbol", "order_action", "quantity", "price_type"]
-
-        for field in required_fields:
-            if field not in order_params or not order_params[field]:
-                return False
+        for field in _REQUIRED_ORDER_FIELDS:
+            if not order_params.get(field):
+                return None
 
         # Validate price_type and related fields
-        if order_params["price_type"] not in ["MARKET", "LIMIT"]:
-            return False
+        if order_params["price_type"] not in _PRICE_TYPES:
+            return None
 
-        if order_params["price_type"] == "LIMIT" and (
-            "limit_price" not in order_params or not order_params["limit_price"]
+        if order_params["price_type"] == "LIMIT" and not order_params.get(
+            "limit_price"
         ):
-            return False
+            return None
 
         # Validate order_action
-        if order_params["order_action"] not in [
-            "BUY",
-            "SELL",
-            "BUY_TO_COVER",
-            "SELL_SHORT",
-        ]:
-            return False
+        if order_params["order_action"] not in _ORDER_ACTIONS:
+            return None
 
         # Validate quantity is numeric
-        try:
-            int(order_params["quantity"])
-        except (ValueError, TypeError):
-            return False
+        quantity = order_params["quantity"]
+        if not isinstance(quantity, int):
+            try:
+                int(quantity)
+            except (ValueError, TypeError):
+                return None
+
+        # Generate client order ID if not provided
+        order = order_params.copy()
+        if not order.get("client_order_id"):
+            order["client_order_id"] = _next_client_order_id()
 
-        return True
+        return order
 
     def preview_order(self, order_params):
         """
@@ -76,74 +227,39 @@ class Order:
         """
 
         # Validate order parameters
-        if not self._validate_order_params(order_params):
+        order = self._validate_order_params(order_params)
+        if order is None:
             return {"success": False, "error": "Invalid order parameters"}
 
-        # Generate client order ID if not provided
-        order = order_params.copy()
-        if "client_order_id" not in order or not order["client_order_id"]:
-            order["client_order_id"] = random.randint(1000000000, 9999999999)
+        return self._submit_preview(order)
 
+    def _submit_preview(self, order):
+        """
+        Send a preview order request for already validated order parameters
+
+        :param order: Order parameters returned by _validate_order_params
+        :return: Dictionary containing preview response or error information
+        """
         # URL for the API endpoint
-        url = (
-            self.base_url
-            + "/v1/accounts/"
-            + self.account["accountIdKey"]
-            + "/orders/preview.json"
-        )
+        url = self._orders_url + "/preview.json"
 
         # Add parameters and header information
-        headers = {
-            "Content-Type": "application/xml",
-            "consumerKey": config["DEFAULT"]["CONSUMER_KEY"],
-        }
+        headers = self._xml_headers
 
         # Add payload for POST Request
-        payload = """<PreviewOrderRequest>
-                       <orderType>EQ</orderType>
-                       <clientOrderId>{0}</clientOrderId>
-                       <Order>
-                           <allOrNone>false</allOrNone>
-                           <priceType>{1}</priceType>
-                           <orderTerm>{2}</orderTerm>
-                           <marketSession>REGULAR</marketSession>
-                           <stopPrice></stopPrice>
-                           <limitPrice>{3}</limitPrice>
-                           <Instrument>
-                               <Product>
-                                   <securityType>EQ</securityType>
-                                   <symbol>{4}</symbol>
-                               </Product>
-                               <orderAction>{5}</orderAction>
-                               <quantityType>QUANTITY</quantityType>
-                               <quantity>{6}</quantity>
-                           </Instrument>
-                       </Order>
-                   </PreviewOrderRequest>"""
-        payload = payload.format(
-            order["client_order_id"],
-            order["price_type"],
-            order.get("order_term", "GOOD_FOR_DAY"),
-            order.get("limit_price", ""),
-            order["symbol"],
-            order["order_action"],
-            order["quantity"],
-        )
+        payload = _build_order_request("PreviewOrderRequest", order)
 
         # Make API call for POST request
         response = self.session.post(
             url, header_auth=True, headers=headers, data=payload
         )
         logger.debug("Request Header: %s", response.request.headers)
-        logger.debug("Request payload: %s", payload)
+        logger.debug("Request payload: %s", payload.decode())
 
         # Handle and parse response
         if response is not None and response.status_code == 200:
-            parsed = json.loads(response.text)
-            logger.debug(
-                "Response Body: %s", json.dumps(parsed, indent=4, sort_keys=True)
-            )
-            data = response.json()
+            data = orjson.loads(response.content)
+            logger.debug("Response Body: %s", _pretty_json(data))
 
             result = {"success": True, "preview_data": {}}
 
@@ -211,7 +327,7 @@ class Order:
             # Handle errors
             if response is not None:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if (
                         "Error" in data
                         and "message" in data["Error"]
@@ -232,81 +348,43 @@ class Order:
         """
 
         # Validate order parameters
-        if not self._validate_order_params(order_params):
+        order = self._validate_order_params(order_params)
+        if order is None:
             return {"success": False, "error": "Invalid order parameters"}
 
         if not preview_id:
             return {"success": False, "error": "Preview ID is required"}
 
-        # Generate client order ID if not provided
-        order = order_params.copy()
-        if "client_order_id" not in order or not order["client_order_id"]:
-            order["client_order_id"] = random.randint(1000000000, 9999999999)
+        return self._submit_place(order, preview_id)
 
+    def _submit_place(self, order, preview_id):
+        """
+        Send a place order request for already validated order parameters
+
+        :param order: Order parameters returned by _validate_order_params
+        :param preview_id: Preview ID from preview_order response
+        :return: Dictionary containing order placement response or error information
+        """
         # URL for the API endpoint
-        url = (
-            self.base_url
-            + "/v1/accounts/"
-            + self.account["accountIdKey"]
-            + "/orders/place.json"
-        )
+        url = self._orders_url + "/place.json"
 
         # Add parameters and header information
-        headers = {
-            "Content-Type": "application/xml",
-            "consumerKey": config["DEFAULT"]["CONSUMER_KEY"],
-        }
+        headers = self._xml_headers
 
         # Add payload for POST Request
-        payload = """<PlaceOrderRequest>
-                       <orderType>EQ</orderType>
-                       <clientOrderId>{0}</clientOrderId>
-                       <PreviewIds>
-                           <previewId>{1}</previewId>
-                       </PreviewIds>
-                       <Order>
-                           <allOrNone>false</allOrNone>
-                           <priceType>{2}</priceType>
-                           <orderTerm>{3}</orderTerm>
-                           <marketSession>REGULAR</marketSession>
-                           <stopPrice></stopPrice>
-                           <limitPrice>{4}</limitPrice>
-                           <Instrument>
-                               <Product>
-                                   <securityType>EQ</securityType>
-                                   <symbol>{5}</symbol>
-                               </Product>
-                               <orderAction>{6}</orderAction>
-                               <quantityType>QUANTITY</quantityType>
-                               <quantity>{7}</quantity>
-                           </Instrument>
-                       </Order>
-                   </PlaceOrderRequest>"""
-        payload = payload.format(
-            order["client_order_id"],
-            preview_id,
-            order["price_type"],
-            order.get("order_term", "GOOD_FOR_DAY"),
-            order.get("limit_price", ""),
-            order["symbol"],
-            order["order_action"],
-            order["quantity"],
-        )
+        payload = _build_order_request("PlaceOrderRequest", order, preview_id)
 
         # Make API call for POST request
         response = self.session.post(
             url, header_auth=True, headers=headers, data=payload
         )
         logger.debug("Request Header: %s", response.request.headers)
-        logger.debug("Request payload: %s", payload)
+        logger.debug("Request payload: %s", payload.decode())
 
         # Handle and parse response
         if response is not None and response.status_code == 200:
-            parsed = json.loads(response.text)
-            logger.debug(
-                "Response Body: %s", json.dumps(parsed, indent=4, sort_keys=True)
-            )
-            data = response.json()
+            data = orjson.loads(response.content)
+            logger.debug("Response Body: %s", _pretty_json(data))
 
             result = {"success": True, "order_data": {}}
 
@@ -373,7 +451,7 @@ class Order:
             # Handle errors
             if response is not None:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if (
                         "Error" in data
                         and "message" in data["Error"]
@@ -384,6 +462,35 @@ class Order:
                     pass
             return {"success": False, "error": "Place Order API service error"}
 
+    def preview_and_place_order(self, order_params):
+        """
+        Preview an order and place it immediately using the returned preview ID
+
+        The E*TRADE API has no combined endpoint, so this still makes the
+        preview and place calls back to back, but with a single client order
+        ID shared by both requests as the API requires.
+
+        :param order_params: Dictionary containing order parameters
+        :return: Dictionary containing order placement response or error information
+        """
+        # Validate once; the same normalized order is used for both requests
+        order = self._validate_order_params(order_params)
+        if order is None:
+            return {"success": False, "error": "Invalid order parameters"}
+
+        preview = self._submit_preview(order)
+        if not preview["success"]:
+            return preview
+
+        preview_ids = preview["preview_data"].get("preview_ids")
+        if not preview_ids or not preview_ids[0]["preview_id"]:
+            return {"success": False, "error": "Preview ID missing from response"}
+
+        result = self._submit_place(order, preview_ids[0]["preview_id"])
+        if result["success"]:
+            result["preview_data"] = preview["preview_data"]
+        return result
+
     def cancel_order(self, order_id):
         """
         Cancel an existing order by order ID
@@ -396,20 +503,10 @@ class Order:
             return {"success": False, "error": "Order ID is required"}
 
         # URL for the API endpoint
-        url = (
-            self.base_url
-            + "/v1/accounts/"
-            + self.account["accountIdKey"]
-            + "/orders/"
-            + str(order_id)
-            + "/cancel.json"
-        )
+        url = self._orders_url + "/" + str(order_id) + "/cancel.json"
 
         # Add parameters and header information
-        headers = {
-            "Content-Type": "application/xml",
-            "consumerKey": config["DEFAULT"]["CONSUMER_KEY"],
-        }
+        headers = self._xml_headers
 
         # Add payload for PUT Request
         payload = """<CancelOrderRequest>
@@ -427,11 +524,8 @@ class Order:
 
         # Handle and parse response
         if response is not None and response.status_code == 200:
-            parsed = json.loads(response.text)
-            logger.debug(
-                "Response Body: %s", json.dumps(parsed, indent=4, sort_keys=True)
-            )
-            data = response.json()
+            data = orjson.loads(response.content)
+            logger.debug("Response Body: %s", _pretty_json(data))
 
             result = {"success": True, "cancellation_data": {}}
 
@@ -460,7 +554,7 @@ class Order:
             # Handle errors
             if response is not None:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if (
                         "Error" in data
                         and "message" in data["Error"]
@@ -489,73 +583,132 @@ class Order:
         """
         Calls orders API to provide the details for the orders
 
+        A failed status request does not abort the others: its list stays
+        empty, success is set to False, errors maps each failed status to its
+        error and error holds the first of them in status order.
+
         :param self: Pass in authenticated session and information on selected account
         :return: Dictionary containing all order categories with their data
         """
         # URL for the API endpoint
-        url = (
-            self.base_url
-            + "/v1/accounts/"
-            + self.account["accountIdKey"]
-            + "/orders.json"
-        )
+        url = self._orders_url + ".json"
 
         # Add parameters and header information
-        headers = {"consumerkey": config["DEFAULT"]["CONSUMER_KEY"]}
-        status_params = {
-            "open": {"status": "OPEN"},
-            "executed": {"status": "EXECUTED"},
-            "individual_fills": {"status": "INDIVIDUAL_FILLS"},
-            "cancelled": {"status": "CANCELLED"},
-            "rejected": {"status": "REJECTED"},
-            "expired": {"status": "EXPIRED"},
-        }
+        headers = self._json_headers
 
         result = {
             "success": True,
-            "orders": {
-                "open": [],
-                "executed": [],
-                "individual_fills": [],
-                "cancelled": [],
-                "rejected": [],
-                "expired": [],
-            },
+            "orders": {status_key: [] for status_key in _ORDER_STATUS_KEYS},
         }
 
-        # Make API calls for each status
-        for status_key, params in status_params.items():
-            try:
-                response = self.session.get(
-                    url, header_auth=True, params=params, headers=headers
-                )
+        # Make API calls for each status concurrently; the requests are
+        # independent, so wall time is bounded by the slowest one
+        with ThreadPoolExecutor(max_workers=len(_ORDER_STATUS_PARAMS)) as executor:
+            futures = {
+                executor.submit(
+                    self.session.get,
+                    url,
+                    header_auth=True,
+                    params=params,
+                    headers=headers,
+                ): status_key
+                for status_key, params in _ORDER_STATUS_PARAMS
+            }
+
+            for future in as_completed(futures):
+                status_key = futures[future]
+                try:
+                    self._store_orders(result, status_key, future.result())
+                except Exception as e:
+                    self._store_orders_error(result, status_key, e)
 
-                logger.debug("Request Header: %s", response.request.headers)
-                logger.debug("Response Body: %s", response.text)
+        return result
 
-                if response.status_code == 200:
-                    parsed = json.loads(response.text)
-                    logger.debug(json.dumps(parsed, indent=4, sort_keys=True))
-                    data = response.json()
-                    result["orders"][status_key] = self.extract_orders_data(
-                        data, status_key
-                    )
-                elif response.status_code == 204:
-                    # No orders for this status
-                    result["orders"][status_key] = []
-                else:
-                    logger.error(
-                        f"Error fetching {status_key} orders: {response.status_code}"
-                    )
+    async def view_orders_async(self):
+        """
+        Asynchronous variant of view_orders for callers running an event loop
 
+        The signed requests are issued on the authenticated session from the
+        loop's default executor, so the six status lists are fetched concurrently
+        without blocking the loop.
+
+        :return: Dictionary containing all order categories with their data
+        """
+        loop = asyncio.get_running_loop()
+        url = self._orders_url + ".json"
+        headers = self._json_headers
+
+        result = {
+            "success": True,
+            "orders": {status_key: [] for status_key in _ORDER_STATUS_KEYS},
+        }
+
+        responses = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    None,
+                    partial(
+                        self.session.get,
+                        url,
+                        header_auth=True,
+                        params=params,
+                        headers=headers,
+                    ),
+                )
+                for _, params in _ORDER_STATUS_PARAMS
+            ),
+            return_exceptions=True,
+        )
+
+        for status_key, response in zip(_ORDER_STATUS_KEYS, responses):
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                self._store_orders(result, status_key, response)
             except Exception as e:
-                logger.error(f"Exception while fetching {status_key} orders: {str(e)}")
-                result["success"] = False
-                result["error"] = f"Error fetching orders: {str(e)}"
-                return result
+                self._store_orders_error(result, status_key, e)
 
         return result
 
+    def _store_orders(self, result, status_key, response):
+        """
+        Parse a single status response from the orders API into result
+
+        :param result: view_orders result dictionary to update
+        :param status_key: order status the response was requested for
+        :param response: response object of a list of orders
+        """
+        logger.debug("Request Header: %s", response.request.headers)
+        logger.debug("Response Body: %s", response.text)
+
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            logger.debug(_pretty_json(data))
+            result["orders"][status_key] = self.extract_orders_data(data, status_key)
+        elif response.status_code == 204:
+            # No orders for this status
+            result["orders"][status_key] = []
+        else:
+            logger.error(f"Error fetching {status_key} orders: {response.status_code}")
+
+    def _store_orders_error(self, result, status_key, error):
+        """
+        Record a failed status request in the view_orders result
+
+        :param result: view_orders result dictionary to update
+        :param status_key: order status the request was made for
+        :param error: exception raised while fetching or parsing the orders
+        """
+        logger.error(f"Exception while fetching {status_key} orders: {str(error)}")
+        result["success"] = False
+        errors = result.setdefault("errors", {})
+        errors[status_key] = f"Error fetching orders: {str(error)}"
+        # requests complete in any order, so report the first failed status
+        # in request order to keep error independent of thread timing
+        result["error"] = next(
+            errors[key] for key in _ORDER_STATUS_KEYS if key in errors
+        )
+
     def extract_orders_data(self, response, status):
         """
         Extracts and formats order data from API response
@@ -570,57 +723,41 @@ class Order:
             and "OrdersResponse" in response
             and "Order" in response["OrdersResponse"]
         ):
+            is_open = status == "open"
+            use_filled = status == "individual_fills"
             for order in response["OrdersResponse"]["Order"]:
                 if order is not None and "OrderDetail" in order:
+                    order_id = order.get("orderId")
+                    order_type = order.get("orderType")
                     for details in order["OrderDetail"]:
                         if details is not None and "Instrument" in details:
-                            for instrument in details["Instrument"]:
-                                order_obj = {
-                                    "order_id": order.get("orderId"),
-                                    "order_type": order.get("orderType"),
-                                    "price_type": details.get("priceType"),
-                                    "order_term": details.get("orderTerm"),
-                                    "limit_price": details.get("limitPrice"),
-                                    "status": details.get("status"),
-                                    "security_type": None,
-                                    "symbol": None,
-                                    "order_action": instrument.get("orderAction"),
-                                    "quantity": instrument.get("orderedQuantity"),
-                                    "filled_quantity": instrument.get("filledQuantity"),
-                                    "average_execution_price": instrument.get(
-                                        "averageExecutionPrice"
-                                    ),
-                                    "bid": (
-                                        details.get("netBid")
-                                        if status == "open"
-                                        else None
-                                    ),
-                                    "ask": (
-                                        details.get("netAsk")
-                                        if status == "open"
-                                        else None
-                                    ),
-                                    "net_price": (
-                                        details.get("netPrice")
-                                        if status == "open"
-                                        else None
-                                    ),
-                                }
-
-                                # Extract product information
-                                if instrument is not None and "Product" in instrument:
-                                    product = instrument["Product"]
-                                    order_obj["security_type"] = product.get(
-                                        "securityType"
-                                    )
-                                    order_obj["symbol"] = product.get("symbol")
-
-                                # For individual fills, use filled quantity instead of ordered quantity
-                                if status == "individual_fills" and instrument.get(
-                                    "filledQuantity"
-                                ):
-                                    order_obj["quantity"] = instrument["filledQuantity"]
-
-                                orders_list.append(order_obj)
+                            # fields shared by every instrument of the order detail
+                            price_type = details.get("priceType")
+                            order_term = details.get("orderTerm")
+                            limit_price = details.get("limitPrice")
+                            order_status = details.get("status")
+                            if is_open:
+                                bid = details.get("netBid")
+                                ask = details.get("netAsk")
+                                net_price = details.get("netPrice")
+                            else:
+                                bid = ask = net_price = None
+
+                            orders_list.extend(
+                                _make_order_row(
+                                    instrument,
+                                    use_filled,
+                                    order_id=order_id,
+                                    order_type=order_type,
+                                    price_type=price_type,
+                                    order_term=order_term,
+                                    limit_price=limit_price,
+                                    status=order_status,
+                                    bid=bid,
+                                    ask=ask,
+                                    net_price=net_price,
+                                )
+                                for instrument in details["Instrument"]
+                            )
 
         return orders_list
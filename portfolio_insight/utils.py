@@ -3,10 +3,12 @@ import webbrowser
 import configparser
 from enum import Enum
 from rauth import OAuth1Service
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .accounts import Accounts
 from .market import Market
-from .order import Order
+from .order import Order, _ORDER_STATUS_KEYS
 
 
 class KeyType(Enum):
@@ -14,48 +16,116 @@ class KeyType(Enum):
     LIVE = "live"
 
 
-def oauth(key_type: KeyType = KeyType.SANDBOX):
-    """Allows user authorization for the sample application with OAuth 1"""
+_config = None
+_etrade_service = None
+
+
+def _get_config():
+    """Load the configuration file on first use and reuse it afterwards"""
+    global _config
+    if _config is not None:
+        return _config
 
-    # loading configuration file
     config = configparser.ConfigParser()
-    config.read("config.ini")
-    print(config.defaults())
+    # only keep the configuration once the file was found, so a call made
+    # before config.ini exists does not leave an empty one for good
+    if config.read("config.ini"):
+        _config = config
+    return config
+
+
+def _get_etrade_service():
+    """Build the E*TRADE OAuth 1 service on first use and reuse it afterwards"""
+    global _etrade_service
+    if _etrade_service is None:
+        config = _get_config()
+        _etrade_service = OAuth1Service(
+            name="etrade",
+            consumer_key=config["DEFAULT"]["CONSUMER_KEY"],
+            consumer_secret=config["DEFAULT"]["CONSUMER_SECRET"],
+            request_token_url="https://api.etrade.com/oauth/request_token",
+            access_token_url="https://api.etrade.com/oauth/access_token",
+            authorize_url="https://us.etrade.com/e/t/etws/authorize?key={}&token={}",
+            base_url="https://api.etrade.com",
+        )
+    return _etrade_service
+
+
+def begin_oauth():
+    """
+    Start the OAuth 1 flow without any user interaction
+
+    Returns:
+        Tuple of (request_token, request_token_secret, authorize_url); the user
+        accepts the agreement at authorize_url to obtain a verification code
+    """
+    etrade = _get_etrade_service()
 
-    etrade = OAuth1Service(
-        name="etrade",
-        consumer_key=config["DEFAULT"]["CONSUMER_KEY"],
-        consumer_secret=config["DEFAULT"]["CONSUMER_SECRET"],
-        request_token_url="https://api.etrade.com/oauth/request_token",
-        access_token_url="https://api.etrade.com/oauth/access_token",
-        authorize_url="https://us.etrade.com/e/t/etws/authorize?key={}&token={}",
-        base_url="https://api.etrade.com",
+    # Step 1: Get OAuth 1 request token and secret
+    request_token, request_token_secret = etrade.get_request_token(
+        params={"oauth_callback": "oob", "format": "json"}
     )
 
+    authorize_url = etrade.authorize_url.format(etrade.consumer_key, request_token)
+    return request_token, request_token_secret, authorize_url
+
+
+def complete_oauth(
+    request_token,
+    request_token_secret,
+    verifier: str,
+    key_type: KeyType = KeyType.SANDBOX,
+):
+    """
+    Finish the OAuth 1 flow started by begin_oauth using a verification code
+
+    Returns:
+        Tuple of (base_url, session) for the selected environment
+    """
+    config = _get_config()
     if key_type == KeyType.SANDBOX:
         base_url = config["DEFAULT"]["SANDBOX_BASE_URL"]
     elif key_type == KeyType.LIVE:
         base_url = config["DEFAULT"]["PROD_BASE_URL"]
 
-    # Step 1: Get OAuth 1 request token and secret
-    request_token, request_token_secret = etrade.get_request_token(
-        params={"oauth_callback": "oob", "format": "json"}
+    # Step 3: Exchange the authorized request token for an authenticated OAuth 1 session
+    session = _get_etrade_service().get_auth_session(
+        request_token, request_token_secret, params={"oauth_verifier": verifier}
+    )
+
+    # keep enough pooled connections for the view_orders fan-out so
+    # requests reuse established TLS connections; only failures to
+    # connect are retried, since a request that may have reached the
+    # server could be an order that would be submitted twice
+    session.mount(
+        base_url,
+        HTTPAdapter(
+            pool_connections=len(_ORDER_STATUS_KEYS),
+            pool_maxsize=len(_ORDER_STATUS_KEYS),
+            max_retries=Retry(connect=2, read=0, other=0, status=0, backoff_factor=0.1),
+        ),
     )
 
+    return base_url, session
+
+
+def oauth(key_type: KeyType = KeyType.SANDBOX):
+    """Allows user authorization for the sample application with OAuth 1"""
+
+    # loading configuration file
+    config = _get_config()
+    print(config.defaults())
+
+    request_token, request_token_secret, authorize_url = begin_oauth()
+
     # Step 2: Go through the authentication flow. Login to E*TRADE.
     # After you login, the page will provide a verification code to enter.
-    authorize_url = etrade.authorize_url.format(etrade.consumer_key, request_token)
     webbrowser.open(authorize_url)
     text_code = input(
         "Please accept agreement and enter verification code from browser: "
     )
 
-    # Step 3: Exchange the authorized request token for an authenticated OAuth 1 session
-    session = etrade.get_auth_session(
-        request_token, request_token_secret, params={"oauth_verifier": text_code}
-    )
-
-    return base_url, session
+    return complete_oauth(request_token, request_token_secret, text_code, key_type)
 
 
 def account_instance(base_url: str, session):
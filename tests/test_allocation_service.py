@@ -3,7 +3,12 @@
 Test suite for the AllocationService class.
 """
 
-from unittest.mock import Mock, patch, MagicMock
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
+
+import pytest
 
 from portfolio_insight.portfolio.allocation import (
     AllocationService,
@@ -12,18 +17,52 @@ from portfolio_insight.portfolio.allocation import (
 from portfolio_insight import utils
 
 
+@pytest.fixture(scope="class")
+def mocks():
+    """Mock session and clients, built once and shared by a test class."""
+    return SimpleNamespace(
+        session=Mock(),
+        base_url="https://api.etrade.com/sandbox",
+        accounts_client=Mock(),
+        market_client=Mock(),
+    )
+
+
 class TestAllocationService:
     """Test class for AllocationService functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
+    @pytest.fixture(autouse=True)
+    def _setup(self, mocks):
+        """Set up test fixtures, resetting the shared mocks afterwards."""
         self.service = AllocationService()
 
-        # Mock session and clients
-        self.mock_session = Mock()
-        self.mock_base_url = "https://api.etrade.com/sandbox"
-        self.mock_accounts_client = Mock()
-        self.mock_market_client = Mock()
+        self.mock_session = mocks.session
+        self.mock_base_url = mocks.base_url
+        self.mock_accounts_client = mocks.accounts_client
+        self.mock_market_client = mocks.market_client
+
+        yield
+
+        for mock in (mocks.session, mocks.accounts_client, mocks.market_client):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(autouse=True)
+    def _patch_utils(self):
+        """Patch the session factories in utils for every test."""
+        with patch.multiple(
+            "portfolio_insight.utils",
+            oauth=DEFAULT,
+            account_instance=DEFAULT,
+            market_instance=DEFAULT,
+        ) as utils_mocks:
+            self._utils_mocks = utils_mocks
+            yield
+
+    def _wire_session(self, session, base_url, accounts_client, market_client):
+        """Make the patched utils return the given session and clients."""
+        self._utils_mocks["oauth"].return_value = (base_url, session)
+        self._utils_mocks["account_instance"].return_value = accounts_client
+        self._utils_mocks["market_instance"].return_value = market_client
 
     def test_initialization(self):
         """Test AllocationService initialization."""
@@ -33,19 +72,16 @@ class TestAllocationService:
         assert service.accounts_client is None
         assert service.market_client is None
         assert service.current_account is None
-        print("✓ Initialization test passed")
-
-    @patch("portfolio_insight.utils.oauth")
-    @patch("portfolio_insight.utils.account_instance")
-    @patch("portfolio_insight.utils.market_instance")
-    def test_start_session_success(
-        self, mock_market_instance, mock_account_instance, mock_oauth
-    ):
+
+    def test_start_session_success(self):
         """Test successful session start."""
         # Setup mocks
-        mock_oauth.return_value = (self.mock_base_url, self.mock_session)
-        mock_account_instance.return_value = self.mock_accounts_client
-        mock_market_instance.return_value = self.mock_market_client
+        self._wire_session(
+            self.mock_session,
+            self.mock_base_url,
+            self.mock_accounts_client,
+            self.mock_market_client,
+        )
 
         # Test session start
         result = self.service.start_session(utils.KeyType.SANDBOX)
@@ -59,20 +95,18 @@ class TestAllocationService:
         assert self.service.market_client == self.mock_market_client
 
         # Verify mock calls
-        mock_oauth.assert_called_once_with(utils.KeyType.SANDBOX)
-        mock_account_instance.assert_called_once_with(
+        self._utils_mocks["oauth"].assert_called_once_with(utils.KeyType.SANDBOX)
+        self._utils_mocks["account_instance"].assert_called_once_with(
             self.mock_base_url, self.mock_session
         )
-        mock_market_instance.assert_called_once_with(
+        self._utils_mocks["market_instance"].assert_called_once_with(
             self.mock_base_url, self.mock_session
         )
-        print("✓ Start session success test passed")
 
-    @patch("portfolio_insight.utils.oauth")
-    def test_start_session_failure(self, mock_oauth):
+    def test_start_session_failure(self):
         """Test session start failure."""
         # Setup mock to raise exception
-        mock_oauth.side_effect = Exception("OAuth failed")
+        self._utils_mocks["oauth"].side_effect = Exception("OAuth failed")
 
         # Test session start
         result = self.service.start_session()
@@ -81,7 +115,6 @@ class TestAllocationService:
         assert result["success"] is False
         assert "OAuth failed" in result["error"]
         assert self.service.session is None
-        print("✓ Start session failure test passed")
 
     def test_get_accounts_no_session(self):
         """Test get_accounts without active session."""
@@ -89,7 +122,6 @@ class TestAllocationService:
 
         assert result["success"] is False
         assert "Session not started" in result["error"]
-        print("✓ Get accounts no session test passed")
 
     def test_get_accounts_success(self):
         """Test successful get_accounts."""
@@ -111,7 +143,6 @@ class TestAllocationService:
         assert result["success"] is True
         assert result["accounts"] == mock_accounts
         self.mock_accounts_client.account_list.assert_called_once()
-        print("✓ Get accounts success test passed")
 
     def test_set_account_no_session(self):
         """Test set_account without active session."""
@@ -120,7 +151,6 @@ class TestAllocationService:
 
         assert result["success"] is False
         assert "Session not started" in result["error"]
-        print("✓ Set account no session test passed")
 
     def test_set_account_success(self):
         """Test successful set_account."""
@@ -139,7 +169,6 @@ class TestAllocationService:
         assert result["success"] is True
         assert self.service.current_account == account_data
         self.mock_accounts_client.set_account.assert_called_once_with(account_data)
-        print("✓ Set account success test passed")
 
     def test_get_current_portfolio_allocation_success(self):
         """Test successful portfolio allocation retrieval."""
@@ -163,7 +192,6 @@ class TestAllocationService:
         assert result["success"] is True
         assert result["current_allocation"] == {"AAPL": 1000.0, "GOOGL": 500.0}
         assert result["positions"] == mock_positions
-        print("✓ Get portfolio allocation success test passed")
 
     def test_get_current_prices_success(self):
         """Test successful current prices retrieval."""
@@ -188,7 +216,6 @@ class TestAllocationService:
         assert result["current_prices"] == {"AAPL": 150.0, "GOOGL": 200.0}
         assert result["quotes"] == mock_quotes
         self.mock_market_client.get_multiple_quotes.assert_called_once_with(symbols)
-        print("✓ Get current prices success test passed")
 
     def test_calculate_allocation_integration(self):
         """Test complete allocation calculation integration."""
@@ -241,8 +268,6 @@ class TestAllocationService:
             assert isinstance(shares, int)
             assert shares >= 0
 
-        print("✓ Calculate allocation integration test passed")
-
     def test_session_status_methods(self):
         """Test session status checking methods."""
         # Test initial state
@@ -275,8 +300,6 @@ class TestAllocationService:
         assert status["current_account"] == {"accountIdKey": "123"}
         assert status["base_url"] == self.mock_base_url
 
-        print("✓ Session status methods test passed")
-
     def test_missing_prices_handling(self):
         """Test handling of missing market prices."""
         # Setup service
@@ -306,55 +329,27 @@ class TestAllocationService:
         # Assertions
         assert result["success"] is False
         assert "Missing current prices" in result["error"]
-        print("✓ Missing prices handling test passed")
-
-
-def run_allocation_service_tests():
-    """Run all AllocationService tests."""
-    print("Running AllocationService tests...")
-    print("=" * 60)
-
-    test_class = TestAllocationService()
-
-    # Run all test methods
-    test_methods = [method for method in dir(test_class) if method.startswith("test_")]
 
-    for test_method in test_methods:
-        test_class.setup_method()
-        getattr(test_class, test_method)()
+    def test_end_to_end_flow_simulation(self):
+        """Test the complete end-to-end flow with mocked data."""
 
-    print("=" * 60)
-    print("✓ All AllocationService tests passed!")
+        # This would simulate a UI workflow:
+        # 1. Start session
+        # 2. Get accounts
+        # 3. Select account
+        # 4. Calculate allocation
 
+        service = AllocationService()
 
-def test_end_to_end_flow_simulation():
-    """Test the complete end-to-end flow with mocked data."""
-    print("\nTesting complete end-to-end flow simulation...")
-
-    # This would simulate a UI workflow:
-    # 1. Start session
-    # 2. Get accounts
-    # 3. Select account
-    # 4. Calculate allocation
-
-    service = AllocationService()
-
-    # Mock the entire flow without actual API calls
-    with patch("portfolio_insight.utils.oauth") as mock_oauth, patch(
-        "portfolio_insight.utils.account_instance"
-    ) as mock_account_instance, patch(
-        "portfolio_insight.utils.market_instance"
-    ) as mock_market_instance:
-
-        # Setup mocks
+        # Mock the entire flow without actual API calls
         mock_session = Mock()
         mock_base_url = "https://api.etrade.com/sandbox"
         mock_accounts_client = Mock()
         mock_market_client = Mock()
 
-        mock_oauth.return_value = (mock_base_url, mock_session)
-        mock_account_instance.return_value = mock_accounts_client
-        mock_market_instance.return_value = mock_market_client
+        self._wire_session(
+            mock_session, mock_base_url, mock_accounts_client, mock_market_client
+        )
 
         # Mock responses
         mock_accounts_client.account_list.return_value = {
@@ -416,33 +411,25 @@ def test_end_to_end_flow_simulation():
         assert allocation_result["investment_amount"] == investment_amount
         assert allocation_result["target_allocation"] == target_allocation
 
-        print("✓ End-to-end flow simulation test passed")
-
         # Print sample output for verification
-        print("\nSample allocation result:")
-        recommendations = allocation_result["allocation_recommendations"]
-        breakdown = allocation_result["allocation_breakdown"]
-
-        for symbol in recommendations:
-            shares = recommendations[symbol]
-            if shares > 0:
-                details = breakdown[symbol]
-                print(
-                    f"  {symbol}: {shares} shares @ ${details['price_per_share']:.2f} = ${details['investment_value']:.2f}"
-                )
-
-        print(
-            f"Total investment value: ${allocation_result['total_investment_value']:.2f}"
-        )
-        print(f"Unused cash: ${allocation_result['unused_cash']:.2f}")
+        if os.environ.get("VERBOSE_TESTS"):
+            print("\nSample allocation result:")
+            recommendations = allocation_result["allocation_recommendations"]
+            breakdown = allocation_result["allocation_breakdown"]
 
+            for symbol in recommendations:
+                shares = recommendations[symbol]
+                if shares > 0:
+                    details = breakdown[symbol]
+                    print(
+                        f"  {symbol}: {shares} shares @ ${details['price_per_share']:.2f} = ${details['investment_value']:.2f}"
+                    )
 
-if __name__ == "__main__":
-    # Run allocation service tests
-    run_allocation_service_tests()
+            print(
+                f"Total investment value: ${allocation_result['total_investment_value']:.2f}"
+            )
+            print(f"Unused cash: ${allocation_result['unused_cash']:.2f}")
 
-    # Run end-to-end simulation
-    test_end_to_end_flow_simulation()
 
-    print("\n" + "=" * 60)
-    print("✓ All tests completed successfully!")
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Order class.
+"""
+
+import asyncio
+import configparser
+import re
+import sys
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+
+from portfolio_insight import order as order_module
+from portfolio_insight.order import Order
+
+BASE_URL = "https://apisb.etrade.com"
+ACCOUNT = {"accountIdKey": "abc123"}
+
+# one order with a single instrument, as returned by the orders API
+ORDERS_BODY = {
+    "OrdersResponse": {
+        "Order": [
+            {
+                "orderId": 101,
+                "orderType": "EQ",
+                "OrderDetail": [
+                    {
+                        "priceType": "LIMIT",
+                        "orderTerm": "GOOD_FOR_DAY",
+                        "limitPrice": 150.0,
+                        "status": "OPEN",
+                        "netBid": 149.5,
+                        "netAsk": 150.5,
+                        "netPrice": 150.0,
+                        "Instrument": [
+                            {
+                                "Product": {"securityType": "EQ", "symbol": "AAPL"},
+                                "orderAction": "BUY",
+                                "orderedQuantity": 10,
+                                "filledQuantity": 4,
+                                "averageExecutionPrice": 149.9,
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+}
+
+# a previewed order as returned by the preview order API
+PREVIEW_BODY = {
+    "PreviewOrderResponse": {
+        "PreviewIds": [{"previewId": 555}, {"previewId": 556}],
+        "Order": [{"priceType": "MARKET", "Instrument": []}],
+    }
+}
+
+# a placed order as returned by the place order API
+PLACE_BODY = {
+    "PlaceOrderResponse": {
+        "OrderIds": [{"orderId": 777}],
+        "Order": [{"priceType": "MARKET", "Instrument": []}],
+    }
+}
+
+# minimal valid market order parameters
+MARKET_ORDER = {
+    "symbol": "AAPL",
+    "order_action": "BUY",
+    "quantity": 10,
+    "price_type": "MARKET",
+}
+
+
+def _response(status_code, body=None):
+    """Build a fake API response with a JSON body."""
+    return Mock(
+        status_code=status_code,
+        content=b"" if body is None else orjson.dumps(body),
+    )
+
+
+@pytest.fixture
+def config():
+    """Configuration standing in for config.ini."""
+    config = configparser.ConfigParser()
+    config["DEFAULT"]["CONSUMER_KEY"] = "test-key"
+    with patch.object(order_module, "config", config):
+        yield config
+
+
+@pytest.fixture
+def session():
+    """Fake authenticated session."""
+    return Mock()
+
+
+@pytest.fixture
+def order(session, config):
+    """Order client bound to the fake session."""
+    return Order(session, ACCOUNT, BASE_URL)
+
+
+def _orders_by_status(responses):
+    """Return a session.get side effect answering each status from responses."""
+
+    def get(url, header_auth, params, headers):
+        assert url == BASE_URL + "/v1/accounts/abc123/orders.json"
+        response = responses.get(params["status"], _response(204))
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    return get
+
+
+def _payload(call):
+    """Return the XML payload sent by a recorded session.post call."""
+    return call.kwargs["data"].decode()
+
+
+class TestOrderInit:
+    """Tests for constructing Order clients."""
+
+    def test_consumer_key_is_read_on_first_request(self, session):
+        """An Order is built without a consumer key until a request needs it."""
+        with patch.object(order_module, "config", configparser.ConfigParser()):
+            order = Order(session, ACCOUNT, BASE_URL)
+            assert order.get_order_options()["price_types"] == ["MARKET", "LIMIT"]
+
+    def test_session_adapters_are_left_alone(self, order, session):
+        """Building an Order does not change how the shared session retries."""
+        session.mount.assert_not_called()
+
+    def test_request_headers_carry_consumer_key(self, order, session):
+        """Requests send the consumer key from config.ini."""
+        session.get.side_effect = _orders_by_status({})
+
+        order.view_orders()
+
+        assert session.get.call_args.kwargs["headers"] == {"consumerkey": "test-key"}
+
+
+class TestOrderRequests:
+    """Tests for the preview and place order request payloads."""
+
+    def test_preview_payload_escapes_fields(self, order, session):
+        """Order fields are escaped in the XML payload."""
+        session.post.return_value = _response(200, PREVIEW_BODY)
+
+        result = order.preview_order(
+            dict(MARKET_ORDER, symbol="A<&>", client_order_id=1234567890)
+        )
+
+        assert result["success"] is True
+        url = session.post.call_args.args[0]
+        assert url == BASE_URL + "/v1/accounts/abc123/orders/preview.json"
+        payload = _payload(session.post.call_args)
+        assert "<clientOrderId>1234567890</clientOrderId>" in payload
+        assert "<symbol>A&lt;&amp;&gt;</symbol>" in payload
+        assert "<priceType>MARKET</priceType>" in payload
+        assert "<orderTerm>GOOD_FOR_DAY</orderTerm>" in payload
+        assert "<quantity>10</quantity>" in payload
+
+    def test_preview_payload_accepts_non_string_fields(self, order, session):
+        """Non-string field values are written as text instead of raising."""
+        session.post.return_value = _response(200, PREVIEW_BODY)
+
+        result = order.preview_order(dict(MARKET_ORDER, symbol=123, order_term=7))
+
+        assert result["success"] is True
+        payload = _payload(session.post.call_args)
+        assert "<symbol>123</symbol>" in payload
+        assert "<orderTerm>7</orderTerm>" in payload
+
+    def test_generated_client_order_id(self, order, session):
+        """A missing client order ID is replaced by a random 10-digit ID."""
+        session.post.return_value = _response(200, PREVIEW_BODY)
+
+        with patch.object(order_module.secrets, "randbelow", return_value=0):
+            order.preview_order(MARKET_ORDER)
+        assert "<clientOrderId>1000000000</clientOrderId>" in _payload(
+            session.post.call_args
+        )
+
+        with patch.object(
+            order_module.secrets, "randbelow", side_effect=lambda n: n - 1
+        ):
+            order.preview_order(MARKET_ORDER)
+        assert "<clientOrderId>9999999999</clientOrderId>" in _payload(
+            session.post.call_args
+        )
+
+
+class TestPreviewAndPlaceOrder:
+    """Tests for previewing and placing an order in one call."""
+
+    def test_place_uses_preview_client_order_id_and_id(self, order, session):
+        """Both requests share a client order ID; the first preview ID is placed."""
+        session.post.side_effect = [
+            _response(200, PREVIEW_BODY),
+            _response(200, PLACE_BODY),
+        ]
+
+        result = order.preview_and_place_order(MARKET_ORDER)
+
+        assert result["success"] is True
+        assert result["order_data"]["order_ids"] == [{"order_id": 777}]
+        assert result["preview_data"]["preview_ids"][0] == {"preview_id": 555}
+
+        preview_call, place_call = session.post.call_args_list
+        assert preview_call.args[0].endswith("/orders/preview.json")
+        assert place_call.args[0].endswith("/orders/place.json")
+        client_order_ids = [
+            re.search(r"<clientOrderId>(\d+)</clientOrderId>", _payload(call))[1]
+            for call in (preview_call, place_call)
+        ]
+        assert client_order_ids[0] == client_order_ids[1]
+        assert "<previewId>555</previewId>" in _payload(place_call)
+
+    def test_failed_preview_is_not_placed(self, order, session):
+        """A failed preview is returned without making the place request."""
+        session.post.return_value = _response(
+            400, {"Error": {"message": "Invalid symbol"}}
+        )
+
+        result = order.preview_and_place_order(MARKET_ORDER)
+
+        assert result == {"success": False, "error": "Invalid symbol"}
+        assert session.post.call_count == 1
+
+    def test_missing_preview_id(self, order, session):
+        """A preview response without preview IDs is reported as an error."""
+        session.post.return_value = _response(
+            200, {"PreviewOrderResponse": {"Order": []}}
+        )
+
+        result = order.preview_and_place_order(MARKET_ORDER)
+
+        assert result == {
+            "success": False,
+            "error": "Preview ID missing from response",
+        }
+        assert session.post.call_count == 1
+
+    def test_invalid_order_is_not_sent(self, order, session):
+        """Invalid order parameters are rejected before any request."""
+        result = order.preview_and_place_order(dict(MARKET_ORDER, quantity="ten"))
+
+        assert result == {"success": False, "error": "Invalid order parameters"}
+        session.post.assert_not_called()
+
+
+class TestViewOrders:
+    """Tests for fetching the order status lists."""
+
+    def test_one_status_failing_keeps_the_others(self, order, session):
+        """A failed status request is reported without dropping other lists."""
+        session.get.side_effect = _orders_by_status(
+            {
+                "OPEN": _response(200, ORDERS_BODY),
+                "EXECUTED": _response(200, ORDERS_BODY),
+                "REJECTED": ConnectionError("connection reset"),
+            }
+        )
+
+        result = order.view_orders()
+
+        assert session.get.call_count == 6
+        assert result["success"] is False
+        assert result["error"] == "Error fetching orders: connection reset"
+        assert len(result["orders"]["open"]) == 1
+        assert len(result["orders"]["executed"]) == 1
+        assert result["orders"]["rejected"] == []
+        assert result["orders"]["cancelled"] == []
+        assert result["errors"] == {
+            "rejected": "Error fetching orders: connection reset"
+        }
+
+    def test_several_statuses_failing(self, order, session):
+        """Every failed status is recorded and error follows status order."""
+        session.get.side_effect = _orders_by_status(
+            {
+                "OPEN": _response(200, ORDERS_BODY),
+                "CANCELLED": ConnectionError("cancelled reset"),
+                "EXECUTED": ConnectionError("executed reset"),
+            }
+        )
+
+        result = order.view_orders()
+
+        assert result["success"] is False
+        assert result["error"] == "Error fetching orders: executed reset"
+        assert result["errors"] == {
+            "executed": "Error fetching orders: executed reset",
+            "cancelled": "Error fetching orders: cancelled reset",
+        }
+        assert len(result["orders"]["open"]) == 1
+
+    @pytest.mark.parametrize(
+        "status,status_key,quote,quantity",
+        [
+            pytest.param(
+                "OPEN",
+                "open",
+                {"bid": 149.5, "ask": 150.5, "net_price": 150.0},
+                10,
+                id="open",
+            ),
+            pytest.param(
+                "EXECUTED",
+                "executed",
+                {"bid": None, "ask": None, "net_price": None},
+                10,
+                id="executed",
+            ),
+            pytest.param(
+                "INDIVIDUAL_FILLS",
+                "individual_fills",
+                {"bid": None, "ask": None, "net_price": None},
+                4,
+                id="individual_fills",
+            ),
+        ],
+    )
+    def test_order_row_shape(self, order, session, status, status_key, quote, quantity):
+        """Order rows are plain dictionaries with every order field."""
+        session.get.side_effect = _orders_by_status(
+            {status: _response(200, ORDERS_BODY)}
+        )
+
+        result = order.view_orders()
+
+        assert result["success"] is True
+        assert result["orders"][status_key] == [
+            {
+                "order_id": 101,
+                "order_type": "EQ",
+                "price_type": "LIMIT",
+                "order_term": "GOOD_FOR_DAY",
+                "limit_price": 150.0,
+                "status": "OPEN",
+                "security_type": "EQ",
+                "symbol": "AAPL",
+                "order_action": "BUY",
+                "quantity": quantity,
+                "filled_quantity": 4,
+                "average_execution_price": 149.9,
+                **quote,
+            }
+        ]
+        assert type(result["orders"][status_key][0]) is dict
+        orjson.dumps(result)
+
+    def test_view_orders_async(self, order, session):
+        """The async variant fills the same lists and reports failed requests."""
+        session.get.side_effect = _orders_by_status(
+            {
+                "OPEN": _response(200, ORDERS_BODY),
+                "EXPIRED": ConnectionError("connection reset"),
+            }
+        )
+
+        result = asyncio.run(order.view_orders_async())
+
+        assert session.get.call_count == 6
+        assert result["success"] is False
+        assert result["error"] == "Error fetching orders: connection reset"
+        assert result["orders"]["open"][0]["symbol"] == "AAPL"
+        assert result["orders"]["expired"] == []
+
+    def test_view_orders_async_cancelled(self, order, session):
+        """A cancelled request propagates instead of being parsed as a response."""
+        session.get.side_effect = _orders_by_status({"OPEN": asyncio.CancelledError()})
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(order.view_orders_async())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
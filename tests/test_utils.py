@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for the utils module.
+"""
+
+import configparser
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from portfolio_insight import utils
+
+CONFIG_INI = """[DEFAULT]
+CONSUMER_KEY = test-key
+CONSUMER_SECRET = test-secret
+SANDBOX_BASE_URL = https://apisb.etrade.com
+PROD_BASE_URL = https://api.etrade.com
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches(monkeypatch):
+    """Start every test without a cached configuration or OAuth service."""
+    monkeypatch.setattr(utils, "_config", None)
+    monkeypatch.setattr(utils, "_etrade_service", None)
+
+
+class TestGetConfig:
+    """Tests for loading config.ini."""
+
+    def test_config_is_cached_once_found(self, tmp_path, monkeypatch):
+        """The configuration is read once and reused afterwards."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "config.ini").write_text(CONFIG_INI)
+
+        config = utils._get_config()
+        (tmp_path / "config.ini").unlink()
+
+        assert config["DEFAULT"]["CONSUMER_KEY"] == "test-key"
+        assert utils._get_config() is config
+
+    def test_missing_config_is_not_cached(self, tmp_path, monkeypatch):
+        """A call made before config.ini exists does not hide the file later."""
+        monkeypatch.chdir(tmp_path)
+
+        assert "CONSUMER_KEY" not in utils._get_config()["DEFAULT"]
+
+        (tmp_path / "config.ini").write_text(CONFIG_INI)
+        assert utils._get_config()["DEFAULT"]["CONSUMER_KEY"] == "test-key"
+
+
+class TestOAuth:
+    """Tests for the non-interactive OAuth steps."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_service(self, monkeypatch):
+        """Replace the E*TRADE OAuth service and load a test configuration."""
+        config = configparser.ConfigParser()
+        config.read_string(CONFIG_INI)
+        monkeypatch.setattr(utils, "_config", config)
+
+        self.etrade = Mock(
+            consumer_key="test-key",
+            authorize_url="https://us.etrade.com/e/t/etws/authorize?key={}&token={}",
+        )
+        with patch.object(utils, "_get_etrade_service", return_value=self.etrade):
+            yield
+
+    def test_begin_oauth(self):
+        """The authorize URL carries the consumer key and request token."""
+        self.etrade.get_request_token.return_value = ("token", "token-secret")
+
+        result = utils.begin_oauth()
+
+        assert result == (
+            "token",
+            "token-secret",
+            "https://us.etrade.com/e/t/etws/authorize?key=test-key&token=token",
+        )
+        self.etrade.get_request_token.assert_called_once_with(
+            params={"oauth_callback": "oob", "format": "json"}
+        )
+
+    @pytest.mark.parametrize(
+        "key_type,base_url",
+        [
+            pytest.param(
+                utils.KeyType.SANDBOX, "https://apisb.etrade.com", id="sandbox"
+            ),
+            pytest.param(utils.KeyType.LIVE, "https://api.etrade.com", id="live"),
+        ],
+    )
+    def test_complete_oauth(self, key_type, base_url):
+        """The verifier is passed through and the environment picks the base URL."""
+        session = Mock()
+        self.etrade.get_auth_session.return_value = session
+
+        result = utils.complete_oauth("token", "token-secret", "12345", key_type)
+
+        assert result == (base_url, session)
+        self.etrade.get_auth_session.assert_called_once_with(
+            "token", "token-secret", params={"oauth_verifier": "12345"}
+        )
+
+    def test_complete_oauth_mounts_adapter(self):
+        """The new session retries only connection failures on the API host."""
+        session = Mock()
+        self.etrade.get_auth_session.return_value = session
+
+        base_url, _ = utils.complete_oauth("token", "token-secret", "12345")
+
+        session.mount.assert_called_once()
+        prefix, adapter = session.mount.call_args.args
+        retries = adapter.max_retries
+        assert prefix == base_url
+        assert retries.connect == 2
+        assert retries.read == 0
+        assert retries.other == 0
+        assert retries.status == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))